@@ -7,10 +7,12 @@ from .base import BaseAlertSender
 from .telegram import TelegramAlertSender
 from .slack import SlackAlertSender
 from .email import EmailAlertSender
+from .multi import MultiChannelAlertSender
 
 __all__ = [
     "BaseAlertSender",
     "TelegramAlertSender",
     "SlackAlertSender",
     "EmailAlertSender",
+    "MultiChannelAlertSender",
 ]
\ No newline at end of file
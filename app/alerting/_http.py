@@ -0,0 +1,44 @@
+"""
+PhoenixAuto-Ops Alerting HTTP Session
+
+Shared requests.Session for the HTTP-based alert senders (Slack, Telegram).
+Reusing one session keeps TLS connections to the webhook/API hosts alive
+between alerts instead of paying DNS + TCP + TLS setup on every send.
+
+Payloads are pre-encoded with dumps_json() and posted as data= with the
+shared JSON_HEADERS, skipping requests' own json= encoding and header merge.
+"""
+
+from typing import Any, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional dependency - stdlib json fallback
+    orjson = None
+    import json
+
+# Transient failures worth retrying at the transport level. POST is listed
+# explicitly because urllib3 only retries idempotent methods by default.
+_RETRY = Retry(
+    total=2,
+    backoff_factor=0.2,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset({"POST"}),
+)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def dumps_json(payload: Dict[str, Any]) -> bytes:
+    """Encode a request payload as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
@@ -5,22 +5,136 @@ Abstract base class for all alert senders.
 Provides common functionality like message formatting,
 cooldown checks, and error handling to ensure consistency
 across Telegram, Email, Slack, and future channels.
+
+Delivery is asynchronous: send_alert() only enqueues the formatted
+message, and a shared pool of background dispatcher threads performs the
+channel-specific network I/O so the monitoring loop never blocks on
+an SMTP handshake or HTTPS round trip.
 """
 
+import atexit
+import logging
+import queue
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 
 from app.utils.config_loader import config
 from app.utils.logger import logger
 
 
+class _AlertDispatcher:
+    """Bounded queue drained by a small pool of daemon worker threads.
+
+    Producers (send_alert) never block: when the queue is full the alert
+    is dropped and counted rather than stalling metric collection. With
+    one worker per channel, an alert fanned out to Telegram, Slack and
+    email is delivered in max(channel latency) rather than the sum.
+    The queue and workers are created on first submit - sized from the
+    alerting.* config then, so importing this module reads no config - and
+    pending alerts are flushed at interpreter exit for up to
+    drain_timeout seconds.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "Optional[queue.Queue[Tuple[BaseAlertSender, str, str, str]]]" = None
+        self._drain_timeout = 10.0
+        self._threads: List[threading.Thread] = []
+        self._start_lock = threading.Lock()
+        self.dropped = 0
+
+    def _ensure_started(self) -> None:
+        """Create the queue and start the worker threads once, on first use."""
+        if self._threads:
+            return
+        with self._start_lock:
+            if not self._threads:
+                # Defaults give one worker per built-in channel
+                self._queue = queue.Queue(maxsize=config.get("alerting.queue_size", 256))
+                self._drain_timeout = config.get("alerting.drain_timeout_seconds", 10)
+                workers = max(1, config.get("alerting.dispatcher_workers", 3))
+                for i in range(workers):
+                    thread = threading.Thread(
+                        target=self._run, name=f"alert-dispatcher-{i}", daemon=True
+                    )
+                    thread.start()
+                    self._threads.append(thread)
+                # Registered here rather than at import so it runs before
+                # (atexit is LIFO) any sender cleanup such as closing the
+                # pooled SMTP connection.
+                atexit.register(self.drain)
+
+    def submit(self, sender: "BaseAlertSender", metric: str, message: str, dedup_key: str) -> bool:
+        """Queue an alert for delivery. Returns False if it was dropped."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((sender, metric, message, dedup_key))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(
+                "Alert queue full - dropped alert for %s",
+                metric,
+                dropped_total=self.dropped,
+            )
+            return False
+
+    def _run(self) -> None:
+        """Worker loop: deliver queued alerts one at a time, forever.
+
+        Senders guard their own shared state (e.g. the pooled SMTP
+        connection), so workers may call _send() concurrently.
+        """
+        while True:
+            sender, metric, message, dedup_key = self._queue.get()
+            try:
+                sender._send(message)
+                logger.info("Alert sent for %s: %s", metric, message)
+            except Exception as e:
+                # Cooldown and dedup start when the alert is queued; a failed
+                # delivery must not hold back the next alert for this metric.
+                sender.last_sent.pop(metric, None)
+                sender._dedup.pop(dedup_key, None)
+                logger.error("Failed to send alert for %s: %s", metric, e)
+            finally:
+                self._queue.task_done()
+
+    def drain(self, timeout: Optional[float] = None) -> None:
+        """Wait until queued alerts are delivered or timeout expires."""
+        if not self._threads:
+            return
+        deadline = time.monotonic() + (self._drain_timeout if timeout is None else timeout)
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(
+                        "Alert queue not fully drained before timeout",
+                        pending=self._queue.unfinished_tasks,
+                    )
+                    return
+                self._queue.all_tasks_done.wait(remaining)
+
+
+# Upper bound on remembered dedup keys per sender (oldest evicted first)
+_DEDUP_MAX_KEYS = 1024
+
+
+# Shared by every sender
+_dispatcher = _AlertDispatcher()
+
+
 class BaseAlertSender(ABC):
     """Base class for all alerting channels.
 
     Responsibilities:
         - Format alert messages uniformly
+        - Drop semantically duplicate alerts before any formatting work
         - Handle cooldown to prevent alert spam
+        - Rate-limit outbound alerts per channel (critical alerts exempt)
+        - Hand delivery off to the background dispatcher
         - Centralized error handling and logging
     """
 
@@ -28,39 +142,120 @@ class BaseAlertSender(ABC):
         """Initialize with config and logger."""
         self.config = config
         self.logger = logger
+        # Subclasses set this False when their credentials are missing
+        self.enabled = True
         self.cooldown_minutes = self.config.get("alerting.cooldown_minutes", 15)
-        self.last_sent: Dict[str, datetime] = {}  # Metric key -> last alert time
+        self._cooldown_ns = int(self.cooldown_minutes * 60 * 1_000_000_000)
+        # Metric key -> time.monotonic_ns() of last alert. Monotonic so an NTP
+        # step or manual clock change can't cut a cooldown short or extend it.
+        self.last_sent: Dict[str, int] = {}
+        self._dedup_window_ns = int(
+            self.config.get("alerting.dedup_window_seconds", 60) * 1_000_000_000
+        )
+        # Dedup key -> monotonic_ns of last accepted alert, in LRU order
+        self._dedup: "OrderedDict[str, int]" = OrderedDict()
+        # Token bucket capping non-critical alerts at rate_per_min per channel
+        self._rate_per_min = float(self.config.get("alerting.rate_per_min", 60))
+        self._bucket_tokens = self._rate_per_min
+        self._bucket_ts = time.monotonic()
+        self._bucket_lock = threading.Lock()
+
+    def _dedup_key(self, metric: str, value: float, threshold: float, level: str) -> str:
+        """Build a coarse key so near-identical readings collapse together.
+
+        The value is bucketed to tenths of the threshold, so e.g. 91% and
+        92% against a 90% threshold share a key and only the first is sent.
+
+        The key includes the metric, so with the default settings the
+        per-metric cooldown (15 min) already covers the dedup window (60 s).
+        Dedup only suppresses extra alerts when alerting.cooldown_minutes is
+        set below alerting.dedup_window_seconds (e.g. 0 to alert on every
+        distinct reading) - it then still collapses repeats of the same
+        reading. It is checked first because it is the cheaper guard.
+        """
+        bucket = int(value / threshold * 10) if threshold else int(value)
+        return f"{metric}|{level}|{bucket}"
+
+    def _is_duplicate(self, key: str, now_ns: int) -> bool:
+        """Check whether this dedup key was accepted within the window."""
+        last_ns = self._dedup.get(key)
+        return last_ns is not None and now_ns - last_ns < self._dedup_window_ns
+
+    def _remember_dedup(self, key: str, now_ns: int) -> None:
+        """Record an accepted dedup key, evicting the oldest when full."""
+        self._dedup[key] = now_ns
+        self._dedup.move_to_end(key)
+        if len(self._dedup) > _DEDUP_MAX_KEYS:
+            self._dedup.popitem(last=False)
 
     def _is_cooldown_over(self, metric_key: str) -> bool:
         """Check if cooldown period has passed for this metric."""
-        last_time = self.last_sent.get(metric_key)
-        if last_time and (datetime.now() - last_time) < timedelta(minutes=self.cooldown_minutes):
-            self.logger.debug(f"Cooldown active for {metric_key}")
+        last_ns = self.last_sent.get(metric_key)
+        if last_ns is not None and time.monotonic_ns() - last_ns < self._cooldown_ns:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Cooldown active for %s", metric_key)
             return False
         return True
 
+    def _take_rate_token(self) -> bool:
+        """Refill the token bucket and consume one token if available."""
+        with self._bucket_lock:
+            now = time.monotonic()
+            self._bucket_tokens = min(
+                self._rate_per_min,
+                self._bucket_tokens + (now - self._bucket_ts) * self._rate_per_min / 60,
+            )
+            self._bucket_ts = now
+            if self._bucket_tokens < 1:
+                return False
+            self._bucket_tokens -= 1
+            return True
+
     def _format_message(self, metric: str, value: float, threshold: float, level: str) -> str:
         """Format a standard alert message."""
         return f"{level.upper()} Alert: {metric} exceeded threshold ({value} > {threshold})"
 
     def send_alert(self, metric: str, value: float, threshold: float, level: str = "warning") -> bool:
-        """Public method to send an alert with cooldown and error handling."""
+        """Queue an alert for delivery, honouring cooldown.
+
+        Returns True once the alert is queued - delivery itself happens on
+        the dispatcher thread, which logs the outcome. Returns False if the
+        channel is disabled, the alert was suppressed as a duplicate, by
+        cooldown or by the rate limit, or it was dropped because the queue
+        is full. Critical alerts are never rate-limited.
+        """
+        if not self.enabled:
+            return False
         try:
+            dedup_key = self._dedup_key(metric, value, threshold, level)
+            now_ns = time.monotonic_ns()
+            if self._is_duplicate(dedup_key, now_ns):
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Duplicate alert suppressed for %s", metric)
+                return False
             if not self._is_cooldown_over(metric):
                 return False
+            if level != "critical" and not self._take_rate_token():
+                self.logger.warning("Alert rate limit reached - dropped alert for %s", metric)
+                return False
             message = self._format_message(metric, value, threshold, level)
-            self._send(message)
-            self.last_sent[metric] = datetime.now()
-            self.logger.info(f"Alert sent for {metric}: {message}", level=level)
+            if not _dispatcher.submit(self, metric, message, dedup_key):
+                return False
+            # Only queued alerts count - one suppressed by cooldown, the
+            # rate limit or a full queue must not block a later retry.
+            self._remember_dedup(dedup_key, now_ns)
+            self.last_sent[metric] = time.monotonic_ns()
+            self.logger.debug("Alert queued for %s", metric, alert_level=level)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to send alert for {metric}: {e}")
+            self.logger.error("Failed to queue alert for %s: %s", metric, e)
             return False
 
     @abstractmethod
     def _send(self, message: str) -> None:
         """Abstract method to implement channel-specific sending logic.
 
-        Must be implemented by subclasses (e.g., Telegram, Email).
+        Called from the dispatcher thread. Must be implemented by
+        subclasses (e.g., Telegram, Email) and should raise on failure.
         """
-        pass
\ No newline at end of file
+        pass
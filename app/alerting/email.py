@@ -5,19 +5,30 @@ Concrete implementation of BaseAlertSender for SMTP email delivery.
 Supports Gmail, Outlook, or any standard SMTP server with SSL.
 """
 
+import atexit
 import smtplib
+import threading
+from typing import List, Optional
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 
 from app.alerting.base import BaseAlertSender
 from app.utils.logger import logger
 
+# Recycle the pooled SMTP connection after this many messages. Providers cap
+# messages per session (SendGrid, SES, Gmail all do), so reconnecting well
+# below those caps avoids mid-burst disconnects while still only paying the
+# TLS handshake + AUTH once per hundred alerts instead of once per alert.
+MAX_MESSAGES_PER_CONNECTION = 100
+
+SUBJECT = "PhoenixAuto-Ops Alert"
+
 
 class EmailAlertSender(BaseAlertSender):
     """SMTP-based email alert sender.
 
     Inherits cooldown, formatting and error handling from BaseAlertSender.
-    Uses secure SMTP_SSL for email delivery.
+    Uses secure SMTP_SSL for email delivery over a single pooled connection
+    that is reused across alerts and closed at interpreter exit.
     """
 
     def __init__(self) -> None:
@@ -30,28 +41,115 @@ class EmailAlertSender(BaseAlertSender):
         self.from_email = self.config.get("email.from_email")
         self.to_email = self.config.get("email.to_email")
 
-        if not all([self.smtp_server, self.username, self.password, self.from_email, self.to_email]):
+        # Envelope recipients and the fixed RFC 5322 header block are built
+        # once; each send only appends the body. to_email may be a
+        # comma-separated list, same as ALERT_EMAIL_RECIPIENTS.
+        self._recipients: List[str] = [
+            addr.strip() for addr in (self.to_email or "").split(",") if addr.strip()
+        ]
+        self._header = (
+            f"From: {self.from_email}\r\n"
+            f"To: {self.to_email}\r\n"
+            f"Subject: {SUBJECT}\r\n"
+            "MIME-Version: 1.0\r\n"
+            "Content-Type: text/plain; charset=\"us-ascii\"\r\n"
+            "Content-Transfer-Encoding: 7bit\r\n"
+            "\r\n"
+        ).encode("ascii", "replace")
+
+        # Lazily-opened pooled connection - guarded by _smtp_lock since
+        # smtplib connections are not safe to share between threads.
+        self._smtp: Optional[smtplib.SMTP_SSL] = None
+        self._messages_on_conn = 0
+        self._smtp_lock = threading.Lock()
+        atexit.register(self.close)
+
+        self.enabled = all([self.smtp_server, self.username, self.password, self.from_email, self.to_email])
+        if not self.enabled:
             self.logger.warning("Email credentials missing in config. Email alerts will be skipped.")
 
-    def _send(self, message: str) -> None:
-        """Send email using SMTP_SSL."""
-        if not all([self.smtp_server, self.username, self.password, self.from_email, self.to_email]):
-            self.logger.warning("Skipping email alert - missing credentials")
-            return
+    def _connect(self) -> smtplib.SMTP_SSL:
+        """Return a live SMTP connection, reconnecting if needed.
 
-        try:
-            msg = MIMEMultipart()
-            msg['From'] = self.from_email
-            msg['To'] = self.to_email
-            msg['Subject'] = "PhoenixAuto-Ops Alert"
+        Reuses the pooled connection while it answers NOOP and is under
+        MAX_MESSAGES_PER_CONNECTION. Caller must hold _smtp_lock.
+        """
+        if self._smtp is not None and self._messages_on_conn >= MAX_MESSAGES_PER_CONNECTION:
+            self._disconnect()
 
-            msg.attach(MIMEText(message, 'plain'))
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] != 250:
+                    self._disconnect()
+            except (smtplib.SMTPException, OSError):
+                self._disconnect()
 
-            with smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, timeout=10) as server:
+        if self._smtp is None:
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, timeout=10)
+            try:
                 server.login(self.username, self.password)
-                server.send_message(msg)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+            self._messages_on_conn = 0
+            self.logger.debug("Opened new SMTP connection")
+
+        return self._smtp
+
+    def _disconnect(self) -> None:
+        """Close the pooled connection, if any. Caller must hold _smtp_lock."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            # Already dropped by the server - just release the socket
+            self._smtp.close()
+        finally:
+            self._smtp = None
+            self._messages_on_conn = 0
+
+    def close(self) -> None:
+        """Close the pooled SMTP connection. Registered with atexit."""
+        with self._smtp_lock:
+            self._disconnect()
+
+    def _build_message(self, message: str) -> bytes:
+        """Serialize the email for sendmail().
+
+        Alert text is plain ASCII in practice, so the common case is just
+        the precomputed header plus the CRLF-normalized body - no MIME
+        object tree or header re-encoding per alert. Anything non-ASCII
+        goes through MIMEText so it is encoded correctly.
+        """
+        if message.isascii():
+            body = message.replace("\r\n", "\n").replace("\n", "\r\n")
+            return self._header + body.encode("ascii")
+
+        msg = MIMEText(message, "plain", "utf-8")
+        msg["From"] = self.from_email
+        msg["To"] = self.to_email
+        msg["Subject"] = SUBJECT
+        return msg.as_bytes()
+
+    def _send(self, message: str) -> None:
+        """Send email over the pooled SMTP_SSL connection."""
+        try:
+            data = self._build_message(message)
+
+            with self._smtp_lock:
+                try:
+                    self._connect().sendmail(self.from_email, self._recipients, data)
+                except smtplib.SMTPServerDisconnected:
+                    # Server closed the idle connection between NOOP and send -
+                    # reconnect and retry exactly once.
+                    self.logger.debug("SMTP connection dropped, reconnecting")
+                    self._disconnect()
+                    self._connect().sendmail(self.from_email, self._recipients, data)
+                self._messages_on_conn += 1
 
             self.logger.debug("Email alert sent successfully")
         except Exception as e:
             self.logger.error(f"Failed to send email alert: {e}")
-            raise
\ No newline at end of file
+            raise
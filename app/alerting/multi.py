@@ -0,0 +1,36 @@
+"""
+PhoenixAuto-Ops Multi-Channel Alert Sender
+
+Fans a single alert out to every configured channel (Telegram, Slack,
+Email, ...) through one call. Each channel keeps its own dedup, cooldown
+and rate limit; delivery runs concurrently on the shared dispatcher pool,
+so total latency is that of the slowest channel rather than the sum.
+"""
+
+from typing import List
+
+from app.alerting.base import BaseAlertSender
+from app.utils.logger import logger
+
+
+class MultiChannelAlertSender:
+    """Composite sender that forwards each alert to all enabled channels.
+
+    Channels without credentials are dropped at construction, so every
+    alert skips them without a per-call check.
+    """
+
+    def __init__(self, senders: List[BaseAlertSender]) -> None:
+        """Keep only the senders whose channel is enabled."""
+        self.logger = logger
+        self._senders = [s for s in senders if s.enabled]
+        if not self._senders:
+            self.logger.warning("No alert channels configured. Alerts will be skipped.")
+
+    def send_alert(self, metric: str, value: float, threshold: float, level: str = "warning") -> bool:
+        """Queue the alert on every channel. Returns True if any accepted it."""
+        accepted = False
+        for sender in self._senders:
+            # Not any(...) - that would short-circuit after the first channel
+            accepted = sender.send_alert(metric, value, threshold, level) or accepted
+        return accepted
@@ -7,6 +7,7 @@ Sends formatted alerts to a Slack channel using Incoming Webhook.
 
 import requests
 
+from app.alerting._http import JSON_HEADERS, dumps_json, session
 from app.alerting.base import BaseAlertSender
 from app.utils.logger import logger
 
@@ -15,7 +16,8 @@ class SlackAlertSender(BaseAlertSender):
     """Slack Incoming Webhook alert sender.
 
     Inherits cooldown, message formatting and error handling from BaseAlertSender.
-    Uses simple POST request to Slack webhook URL.
+    Uses a POST request to the Slack webhook URL over the shared
+    keep-alive session.
     """
 
     def __init__(self) -> None:
@@ -23,23 +25,20 @@ class SlackAlertSender(BaseAlertSender):
         super().__init__()
         self.webhook_url = self.config.get("slack.webhook_url")
 
-        if not self.webhook_url:
+        self.enabled = bool(self.webhook_url)
+        if not self.enabled:
             self.logger.warning("Slack webhook URL missing in config. Alerts will be skipped.")
 
     def _send(self, message: str) -> None:
         """Send message to Slack via Incoming Webhook."""
-        if not self.webhook_url:
-            self.logger.warning("Skipping Slack alert - missing webhook URL")
-            return
-
-        payload = {"text": message}
+        body = dumps_json({"text": message})
 
         try:
-            response = requests.post(
+            response = session.post(
                 self.webhook_url,
-                json=payload,
+                data=body,
                 timeout=10,
-                headers={"Content-Type": "application/json"}
+                headers=JSON_HEADERS
             )
             response.raise_for_status()
             self.logger.debug("Slack message sent successfully")
@@ -7,6 +7,7 @@ Sends formatted alerts to a specific chat/channel with proper error handling.
 
 import requests
 
+from app.alerting._http import JSON_HEADERS, dumps_json, session
 from app.alerting.base import BaseAlertSender
 from app.utils.logger import logger
 
@@ -15,7 +16,8 @@ class TelegramAlertSender(BaseAlertSender):
     """Telegram Bot API alert sender.
 
     Inherits cooldown, formatting and error handling from BaseAlertSender.
-    Uses requests to call Telegram sendMessage endpoint.
+    Calls the Telegram sendMessage endpoint over the shared keep-alive
+    session.
     """
 
     def __init__(self) -> None:
@@ -23,27 +25,23 @@ class TelegramAlertSender(BaseAlertSender):
         super().__init__()
         self.bot_token = self.config.get("telegram.bot_token")
         self.chat_id = self.config.get("telegram.chat_id")
+        self._url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
 
-        if not self.bot_token or not self.chat_id:
+        self.enabled = bool(self.bot_token and self.chat_id)
+        if not self.enabled:
             self.logger.warning("Telegram credentials missing in config. Alerts will be skipped.")
 
     def _send(self, message: str) -> None:
         """Send message via Telegram Bot API."""
-        if not self.bot_token or not self.chat_id:
-            self.logger.warning("Skipping Telegram alert - missing credentials")
-            return
-
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-
-        payload = {
+        body = dumps_json({
             "chat_id": self.chat_id,
             "text": message,
             "parse_mode": "HTML",
             "disable_web_page_preview": True
-        }
+        })
 
         try:
-            response = requests.post(url, json=payload, timeout=10)
+            response = session.post(self._url, data=body, headers=JSON_HEADERS, timeout=10)
             response.raise_for_status()
             self.logger.debug("Telegram message sent successfully")
         except requests.exceptions.RequestException as e:
@@ -12,6 +12,7 @@ from app.monitoring.system import SystemMetrics
 from app.monitoring.network import NetworkMetrics
 from app.alerting.telegram import TelegramAlertSender
 from app.alerting.slack import SlackAlertSender
+from app.alerting.multi import MultiChannelAlertSender
 from app.healing.actions import HealingActions
 from app.utils.logger import logger
 from app.utils.config_loader import config
@@ -24,8 +25,10 @@ class MonitoringEngine:
         """Initialize all modules."""
         self.system_metrics = SystemMetrics()
         self.network_metrics = NetworkMetrics()
-        self.telegram_alert = TelegramAlertSender()
-        self.slack_alert = SlackAlertSender()
+        self.alerts = MultiChannelAlertSender([
+            TelegramAlertSender(),
+            SlackAlertSender(),
+        ])
         self.healing = HealingActions()
         self.cycle_interval = config.get("engine.cycle_interval_seconds", 60)
 
@@ -70,8 +73,7 @@ class MonitoringEngine:
             message = f"CRITICAL: {metric_key} exceeded threshold ({value} > {threshold})"
             logger.warning(message)
 
-            self.telegram_alert.send_alert(metric_key, value, threshold, "critical")
-            self.slack_alert.send_alert(metric_key, value, threshold, "critical")
+            self.alerts.send_alert(metric_key, value, threshold, "critical")
 
     def _trigger_healing(self, system_data: dict, network_data: dict) -> None:
         """Trigger appropriate healing actions."""
@@ -90,10 +92,12 @@ class MonitoringEngine:
         """Request a graceful stop after the current cycle finishes.
 
         Called from main.py's SIGTERM handler. Does not interrupt a cycle
-        already in progress - it just stops the next one from starting.
+        already in progress - it just stops the next one from starting -
+        except that a healing action waiting to retry gives up immediately.
         """
         logger.info("Shutdown requested - will stop after current cycle")
         self._shutdown_requested = True
+        self.healing.shutdown()
 
     def _interruptible_sleep(self, seconds: int) -> None:
         """Sleep in 1s increments so shutdown() takes effect within ~1s
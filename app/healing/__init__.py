@@ -3,7 +3,7 @@ Healing package for PhoenixAuto-Ops.
 Exposes base healing classes for easy import.
 """
 
-from .base import BaseHealer
+from .base import BaseHealer, HealingAborted
 from .actions import HealingActions
 
-__all__ = ["BaseHealer", "HealingActions"]
\ No newline at end of file
+__all__ = ["BaseHealer", "HealingAborted", "HealingActions"]
\ No newline at end of file
@@ -4,21 +4,47 @@ PhoenixAuto-Ops Healing Actions
 
 Concrete healing actions that call secure shell scripts or system commands.
 All operations respect dry-run mode, retry logic, and logging from BaseHealer.
+
+Service restarts go straight to systemd over D-Bus when the optional
+pystemd package is installed and the process may manage units (running as
+root, or auto_healing.systemd_dbus is set), and use service_manager.sh
+otherwise.
 """
 
+import os
 import subprocess
 from pathlib import Path
-from typing import List
+from typing import Any, List, Optional
 
 from app.healing.base import BaseHealer
 from app.utils.logger import logger
 
+try:
+    from pystemd.systemd1 import Manager as SystemdManager
+except ImportError:  # optional dependency - shell script fallback is used
+    SystemdManager = None
+
+
+# D-Bus error names (and text) systemd/polkit use when a caller may not
+# manage units
+_ACCESS_ERROR_MARKERS = ("AccessDenied", "InteractiveAuthorizationRequired", "Access denied")
+
+
+def _is_access_error(exc: Exception) -> bool:
+    """Return True if a D-Bus call failed because the caller lacks permission."""
+    if isinstance(exc, PermissionError):
+        return True
+    text = f"{type(exc).__name__} {exc}"
+    return any(marker in text for marker in _ACCESS_ERROR_MARKERS)
+
 
 class HealingActions(BaseHealer):
     """Healing actions using external shell scripts or direct system commands.
 
     Calls service_manager.sh and cleanup.sh via subprocess for safe execution.
-    Direct commands used where shell script is not needed.
+    Direct commands used where shell script is not needed. Service restarts
+    use the systemd D-Bus API directly when pystemd is available and
+    usable, avoiding a fork+exec of the script and systemctl per action.
     """
 
     def __init__(self) -> None:
@@ -29,8 +55,25 @@ class HealingActions(BaseHealer):
             self.logger.error("Scripts directory not found: %s", self.scripts_dir)
             raise FileNotFoundError("Scripts directory missing")
 
+        # Opened lazily on first service action; False once it has failed
+        # so we stop retrying the bus and stay on the shell script. An
+        # unprivileged user (the documented sudoers setup) can connect to
+        # the bus but polkit refuses unit jobs, so D-Bus is only tried as
+        # root unless explicitly enabled.
+        use_dbus = os.geteuid() == 0 or self.config.get("auto_healing.systemd_dbus", False)
+        self._systemd: Optional[Any] = None if SystemdManager is not None and use_dbus else False
+
     def restart_service(self, service_name: str) -> bool:
-        """Restart a systemd service using shell script."""
+        """Restart a systemd service via D-Bus, or the shell script fallback."""
+        if self._get_systemd_manager():
+            return self._safe_execute(
+                f"restart {service_name}",
+                self._run_systemd_job_or_script,
+                "RestartUnit",
+                service_name,
+                "restart"
+            )
+
         script = self.scripts_dir / "service_manager.sh"
         return self._safe_execute(
             f"restart {service_name}",
@@ -68,6 +111,50 @@ class HealingActions(BaseHealer):
             script
         )
 
+    def _get_systemd_manager(self) -> Optional[Any]:
+        """Return a loaded systemd Manager proxy, or None if unavailable."""
+        if self._systemd is None:
+            try:
+                manager = SystemdManager()
+                manager.load()
+                self._systemd = manager
+            except Exception as e:
+                self.logger.warning("systemd D-Bus unavailable, using service_manager.sh: %s", e)
+                self._systemd = False
+        return self._systemd or None
+
+    def _run_systemd_job(self, method: str, service_name: str) -> bool:
+        """Queue a unit job (RestartUnit, StartUnit, StopUnit) on systemd."""
+        unit = service_name if "." in service_name else f"{service_name}.service"
+        if self.dry_run:
+            self.logger.info("[DRY-RUN] Would call systemd %s: %s", method, unit)
+            return True
+
+        self.logger.debug("Calling systemd %s: %s", method, unit)
+        getattr(self._systemd.Manager, method)(unit.encode(), b"replace")
+        return True
+
+    def _run_systemd_job_or_script(self, method: str, service_name: str, script_action: str) -> bool:
+        """Run a unit job over D-Bus, switching to service_manager.sh if refused.
+
+        A permission failure is permanent for this process, so the bus is
+        dropped for later actions too instead of failing every retry.
+        """
+        if self._systemd:
+            try:
+                return self._run_systemd_job(method, service_name)
+            except Exception as e:
+                if not _is_access_error(e):
+                    raise
+                self.logger.warning(
+                    "systemd refused %s for %s, using service_manager.sh: %s",
+                    method, service_name, e
+                )
+                self._systemd = False
+
+        script = self.scripts_dir / "service_manager.sh"
+        return self._run_shell_script(script, script_action, service_name)
+
     def _run_shell_script(self, script_path: Path, *args: str) -> bool:
         """Run shell script with proper error handling and timeout."""
         if not script_path.exists():
@@ -7,20 +7,28 @@ retry logic, and centralized logging to ensure
 consistent and safe healing across the system.
 """
 
+import threading
 from abc import ABC, abstractmethod
 from typing import Any
-from time import sleep
 
 from app.utils.config_loader import config
 from app.utils.logger import logger
 
+# Cap on the exponential backoff between retry attempts, in seconds
+MAX_RETRY_BACKOFF_SECONDS = 30
+
+
+class HealingAborted(Exception):
+    """Raised when shutdown() interrupts a healing action between retries."""
+
 
 class BaseHealer(ABC):
     """Base class for all self-healing actions.
 
     Responsibilities:
         - Handle dry-run mode for safe testing
-        - Provide retry mechanism with configurable attempts
+        - Provide retry mechanism with configurable attempts and
+          exponential backoff, cancellable via shutdown()
         - Centralized logging and error handling
     """
 
@@ -31,6 +39,11 @@ class BaseHealer(ABC):
         self.healing_enabled = self.config.get("auto_healing.enabled", True)
         self.max_retries = self.config.get("auto_healing.max_retry_attempts", 3)
         self.dry_run = self.config.get("auto_healing.dry_run", True)
+        self._stop_event = threading.Event()
+
+    def shutdown(self) -> None:
+        """Abort any retry backoff in progress and skip further retries."""
+        self._stop_event.set()
 
     def _should_heal(self) -> bool:
         """Check if healing is enabled in config."""
@@ -40,22 +53,28 @@ class BaseHealer(ABC):
         return True
 
     def _safe_execute(self, action_name: str, func, *args, **kwargs) -> Any:
-        """Execute healing action with retry and error handling."""
+        """Execute healing action with retry and error handling.
+
+        Waits 2s, 4s, 8s... (capped at MAX_RETRY_BACKOFF_SECONDS) between
+        attempts. Raises HealingAborted if shutdown() is called while waiting.
+        """
         for attempt in range(1, self.max_retries + 1):
             try:
                 if self.dry_run:
-                    self.logger.info(f"[DRY-RUN] Would execute: {action_name}")
+                    self.logger.info("[DRY-RUN] Would execute: %s", action_name)
                     return True
 
                 result = func(*args, **kwargs)
-                self.logger.info(f"Healing action succeeded: {action_name}")
+                self.logger.info("Healing action succeeded: %s", action_name)
                 return result
             except Exception as e:
-                self.logger.warning(f"Attempt {attempt}/{self.max_retries} failed for {action_name}: {e}")
+                self.logger.warning("Attempt %d/%d failed for %s: %s", attempt, self.max_retries, action_name, e)
                 if attempt == self.max_retries:
-                    self.logger.error(f"All retry attempts failed for {action_name}")
+                    self.logger.error("All retry attempts failed for %s", action_name)
                     raise
-                sleep(2)  # small delay between retries
+                backoff = min(2 ** attempt, MAX_RETRY_BACKOFF_SECONDS)
+                if self._stop_event.wait(backoff):
+                    raise HealingAborted(f"Shutdown requested during retries of {action_name}")
 
     @abstractmethod
     def heal(self, **kwargs) -> bool:
@@ -7,12 +7,19 @@ error handling, and logging to ensure consistency
 across CPU, Memory, Disk, and future metrics.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from app.utils.config_loader import config
 from app.utils.logger import logger
 
+# Shortest window a non-blocking rate sample (CPU %, network MB/s) may cover.
+# psutil's CPU times advance in 10 ms ticks, so a delta over a millisecond
+# or two - e.g. the first collect() right after __init__ primed the
+# baseline - is noise that swings between 0% and 100%.
+MIN_SAMPLE_WINDOW_SECONDS = 0.1
+
 
 class BaseMetricCollector(ABC):
     """Base class for all system metric collectors.
@@ -20,6 +27,7 @@ class BaseMetricCollector(ABC):
     Responsibilities:
         - Load configuration thresholds
         - Centralized error handling and logging
+        - Short-lived caching of the last collection
         - Abstract interface for metric collection
     """
 
@@ -27,28 +35,60 @@ class BaseMetricCollector(ABC):
         """Initialize with config and logger."""
         self.config = config
         self.logger = logger
+        # Last collect() result, reused for cache_ttl seconds so a caller
+        # that collects and then health-checks doesn't sweep psutil twice.
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_ts = 0.0
+        self._cache_ttl = self.config.get("monitoring.cache_ttl_seconds", 0.5)
+        # Subclasses resolve their thresholds once here instead of per poll
+        self._thresholds: Dict[str, float] = {}
 
     def get_threshold(self, metric_key: str, default: float = 80.0) -> float:
         """Safely retrieve threshold from config."""
         try:
             return self.config.get_threshold(metric_key, default)
         except Exception as e:
-            self.logger.warning(f"Failed to load threshold for {metric_key}: {e}")
+            self.logger.warning("Failed to load threshold for %s: %s", metric_key, e)
             return default
 
-    @abstractmethod
     def collect(self) -> Dict[str, Any]:
         """Collect all metrics for this collector.
 
+        Returns the cached result if the last collection is younger than
+        cache_ttl, otherwise runs _collect_impl() and caches its result.
+        Returns a dictionary of metric_name -> value.
+        """
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache_ts < self._cache_ttl:
+            return self._cache
+        self._cache = self._collect_impl()
+        self._cache_ts = now
+        return self._cache
+
+    @abstractmethod
+    def _collect_impl(self) -> Dict[str, Any]:
+        """Perform a fresh collection, bypassing the cache.
+
         Must be implemented by subclasses.
         Returns a dictionary of metric_name -> value.
         """
         pass
 
+    def _wait_for_sample_window(self, last_sample_t: float) -> None:
+        """Sleep until MIN_SAMPLE_WINDOW_SECONDS have passed since last_sample_t.
+
+        Only blocks when a sample follows the previous one almost
+        immediately, i.e. the first cycle after startup; at the engine's
+        normal cadence the window has long passed and this returns at once.
+        """
+        remaining = MIN_SAMPLE_WINDOW_SECONDS - (time.monotonic() - last_sample_t)
+        if remaining > 0:
+            time.sleep(remaining)
+
     def _safe_execute(self, func, *args, **kwargs) -> Any:
         """Wrapper to safely execute metric collection functions."""
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            self.logger.error(f"Metric collection failed in {func.__name__}, error=str(e)")
+            self.logger.error("Metric collection failed in %s: %s", func.__name__, e)
             return None
\ No newline at end of file
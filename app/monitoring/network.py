@@ -2,7 +2,7 @@
 PhoenixAuto-Ops Network Metrics Collector
 
 Collects network-related system metrics using psutil:
-- Bytes sent/received (per second)
+- Bytes sent/received (MB per second, since the previous collection)
 - Active TCP connections
 - Optional: simple latency check (future)
 
@@ -11,7 +11,7 @@ threshold handling, logging, and error safety.
 """
 
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 import psutil
 
@@ -26,7 +26,19 @@ class NetworkMetrics(BaseMetricCollector):
     Designed to be lightweight and production-safe.
     """
 
-    def collect(self) -> Dict[str, Any]:
+    def __init__(self) -> None:
+        """Initialize collector and take the baseline I/O counter sample."""
+        super().__init__()
+        self._last_io: Optional[Any] = None
+        self._last_t = 0.0
+        # Prime the baseline; _sample() waits out MIN_SAMPLE_WINDOW_SECONDS
+        # from it so the first collect() still covers a meaningful window
+        self._safe_execute(self._sample)
+        self._thresholds = {
+            "network_connections": self.get_threshold("network.max_connections", 500),
+        }
+
+    def _collect_impl(self) -> Dict[str, Any]:
         """Collect all network metrics in one call.
 
         Returns:
@@ -34,56 +46,90 @@ class NetworkMetrics(BaseMetricCollector):
         """
         self.logger.debug("Starting network metrics collection")
 
+        sent, recv = self._safe_execute(self._sample) or (0.0, 0.0)
         metrics = {
-            "network_bytes_sent_per_sec": self._safe_execute(self._get_bytes_sent),
-            "network_bytes_recv_per_sec": self._safe_execute(self._get_bytes_recv),
+            "network_bytes_sent_per_sec": sent,
+            "network_bytes_recv_per_sec": recv,
             "network_connections": self._safe_execute(self._get_connections),
         }
 
         self.logger.info("Network metrics collected", **metrics)
         return metrics
 
-    def _get_bytes_sent(self) -> float:
-        """Get bytes sent per second (delta over 1 second)."""
-        try:
-            io1 = psutil.net_io_counters()
-            time.sleep(1)
-            io2 = psutil.net_io_counters()
-            return (io2.bytes_sent - io1.bytes_sent) / 1024 / 1024  # MB/s
-        except Exception as e:
-            self.logger.warning(f"Failed to get bytes sent: {e}")
-            return 0.0
+    def _sample(self) -> Tuple[float, float]:
+        """Get MB/s sent and received since the previous sample.
 
-    def _get_bytes_recv(self) -> float:
-        """Get bytes received per second (delta over 1 second)."""
+        Non-blocking: stores the counters and a monotonic timestamp on each
+        call and reports the delta against the last stored sample (the same
+        approach psutil.cpu_percent(interval=None) uses). Returns (0.0, 0.0)
+        when there is no previous sample yet. A sample taken right after
+        the previous one first waits out the minimum window, since a rate
+        over a millisecond or two is meaningless.
+        """
         try:
-            io1 = psutil.net_io_counters()
-            time.sleep(1)
-            io2 = psutil.net_io_counters()
-            return (io2.bytes_recv - io1.bytes_recv) / 1024 / 1024  # MB/s
+            if self._last_io is not None:
+                self._wait_for_sample_window(self._last_t)
+            io = psutil.net_io_counters()
+            now = time.monotonic()
+            prev, prev_t = self._last_io, self._last_t
+            self._last_io, self._last_t = io, now
+
+            dt = now - prev_t
+            if prev is None or dt <= 0:
+                return 0.0, 0.0
+            sent = (io.bytes_sent - prev.bytes_sent) / dt / 1024 / 1024  # MB/s
+            recv = (io.bytes_recv - prev.bytes_recv) / dt / 1024 / 1024  # MB/s
+            return sent, recv
         except Exception as e:
-            self.logger.warning(f"Failed to get bytes received: {e}")
-            return 0.0
+            self.logger.warning("Failed to sample network I/O counters: %s", e)
+            return 0.0, 0.0
 
     def _get_connections(self) -> int:
-        """Get count of active TCP connections."""
+        """Get count of active TCP connections.
+
+        On Linux this just counts rows in /proc/net/tcp and tcp6 (under
+        psutil.PROCFS_PATH, so host-monitoring mode still applies) - the
+        same sockets psutil.net_connections(kind="tcp") reports, without
+        building a tuple per socket or scanning every process's fds to map
+        sockets to PIDs. Falls back to psutil where /proc isn't available.
+        """
+        try:
+            return self._count_proc_tcp_sockets()
+        except OSError:
+            pass
+
         try:
             return len(psutil.net_connections(kind="tcp"))
         except Exception as e:
-            self.logger.warning(f"Failed to get connections: {e}")
+            self.logger.warning("Failed to get connections: %s", e)
             return 0
 
+    @staticmethod
+    def _count_proc_tcp_sockets() -> int:
+        """Count socket rows in the procfs TCP tables (header line excluded)."""
+        procfs = getattr(psutil, "PROCFS_PATH", "/proc")
+        total = 0
+        for table in ("tcp", "tcp6"):
+            try:
+                with open(f"{procfs}/net/{table}", "rb") as f:
+                    total += max(sum(1 for _ in f) - 1, 0)
+            except FileNotFoundError:
+                if table == "tcp":
+                    raise
+                # IPv6 disabled - tcp6 table simply doesn't exist
+        return total
+
     def is_healthy(self, metrics: Optional[Dict[str, Any]] = None) -> bool:
         """Check if network metrics are within thresholds.
         
         Args:
             metrics: Already-collected metrics dict from this same cycle.
-                Pass this to skip a second collect() - each collect() here
-                costs roughly 2s just from the two I/O-delta sleeps, so a
-                redundant call is real wall-clock cost, not just noise.
+                Pass this to skip a second collect() - once the cached
+                result has expired, a redundant call would also advance the
+                I/O baseline and shrink the next rate window.
         """
         if metrics is None:
             metrics = self.collect()
-        connections_ok = metrics["network_connections"] < self.get_threshold("network.max_connections", 500)
+        connections_ok = metrics["network_connections"] < self._thresholds["network_connections"]
         # Latency threshold can be added later
         return connections_ok
\ No newline at end of file
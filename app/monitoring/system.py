@@ -13,7 +13,8 @@ error handling, logging, and threshold access.
 
 import psutil
 import os
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Optional, Tuple
 
 from app.monitoring.base import BaseMetricCollector
 from app.utils.logger import logger
@@ -34,7 +35,7 @@ _DISK_CHECK_PATH = _HOST_ROOT_PATH if _HOST_ROOT_PATH else "/"
 _HOST_PROC_PATH = os.environ.get("HOST_PROC_PATH")
 if _HOST_PROC_PATH and hasattr(psutil, "PROCFS_PATH"):
     setattr(psutil, "PROCFS_PATH", _HOST_PROC_PATH)
-    logger.info(f"Host monitoring mode enabled (PROCFS_PATH={_HOST_PROC_PATH})")
+    logger.info("Host monitoring mode enabled (PROCFS_PATH=%s)", _HOST_PROC_PATH)
 
 class SystemMetrics(BaseMetricCollector):
     """Concrete collector for core system metrics.
@@ -43,7 +44,30 @@ class SystemMetrics(BaseMetricCollector):
     Applies thresholds from config to determine health status.
     """
 
-    def collect(self) -> Dict[str, Any]:
+    def __init__(self) -> None:
+        """Initialize collector and prime psutil's CPU baseline."""
+        super().__init__()
+        # The first interval=None call has nothing to compare against and
+        # returns a meaningless 0.0 - take it here as the baseline. The
+        # engine collects right after construction, so _get_cpu_usage()
+        # also waits out MIN_SAMPLE_WINDOW_SECONDS from this sample.
+        self._safe_execute(psutil.cpu_percent, interval=None)
+        self._cpu_sample_t = time.monotonic()
+        self._thresholds = {
+            "cpu_usage_percent": self.get_threshold("cpu_usage_percent"),
+            "memory_usage_percent": self.get_threshold("memory_usage_percent"),
+            "disk_usage_percent": self.get_threshold("disk_usage_percent"),
+            "load_average": self.get_threshold("load_average_limit"),
+        }
+
+        # Slow-moving metrics are re-read on their own, longer TTLs than the
+        # per-cycle ones: (monotonic timestamp, value), None until first read.
+        self._disk_ttl = self.config.get("monitoring.disk_ttl_seconds", 30.0)
+        self._disk_cache: Optional[Tuple[float, float]] = None
+        self._load_ttl = self.config.get("monitoring.load_ttl_seconds", 10.0)
+        self._load_cache: Optional[Tuple[float, float]] = None
+
+    def _collect_impl(self) -> Dict[str, Any]:
         """Collect all system metrics in one call.
 
         Returns:
@@ -58,12 +82,23 @@ class SystemMetrics(BaseMetricCollector):
             "load_average": self._safe_execute(self._get_load_average),
         }
 
-        self.logger.info(f"System metrics collected", **metrics)
+        self.logger.info("System metrics collected", **metrics)
         return metrics
 
     def _get_cpu_usage(self) -> float:
-        """Get current CPU usage percentage (1-second interval)."""
-        return psutil.cpu_percent(interval=1)
+        """Get CPU usage percentage averaged since the previous call.
+
+        Non-blocking (interval=None): psutil compares against the times it
+        recorded on the last call, so the value covers one engine cycle.
+        That relies on collect() running at a steady cadence, which
+        run_forever() provides; a sample taken too soon after the previous
+        one (the first cycle after startup) first waits out the minimum
+        window instead of reporting tick noise.
+        """
+        self._wait_for_sample_window(self._cpu_sample_t)
+        value = psutil.cpu_percent(interval=None)
+        self._cpu_sample_t = time.monotonic()
+        return value
 
     def _get_memory_usage(self) -> float:
         """Get memory usage as percentage of total RAM."""
@@ -74,31 +109,38 @@ class SystemMetrics(BaseMetricCollector):
 
         Checks HOST_ROOT_PATH (the host's bind-mounted /) in containerized
         host-monitoring mode, otherwise the local root - see module-level
-        _DISK_CHECK_PATH.
+        _DISK_CHECK_PATH. Cached for disk_ttl seconds, since usage barely
+        moves between cycles and statvfs can be slow on network mounts.
         """
-        return psutil.disk_usage(_DISK_CHECK_PATH).percent
+        now = time.monotonic()
+        if self._disk_cache is None or now - self._disk_cache[0] > self._disk_ttl:
+            self._disk_cache = (now, psutil.disk_usage(_DISK_CHECK_PATH).percent)
+        return self._disk_cache[1]
 
     def _get_load_average(self) -> float:
-        """Get 1-minute system load average."""
-        return psutil.getloadavg()[0]
+        """Get 1-minute system load average, cached for load_ttl seconds."""
+        now = time.monotonic()
+        if self._load_cache is None or now - self._load_cache[0] > self._load_ttl:
+            self._load_cache = (now, psutil.getloadavg()[0])
+        return self._load_cache[1]
 
     def is_healthy(self, metrics: Optional[Dict[str, Any]] = None) -> bool:
         """Check if all metrics are below warning thresholds.
         Args:
             metrics: Already-collected metrics dict from this same cycle.
                 Pass this whenever the caller already has fresh data so we
-                don't pay for a second psutil pass (and, since network
-                collection sleeps for I/O deltas, don't double that cost
-                either). Falls back to collecting fresh data if omitted,
+                don't pay for a second psutil pass. Falls back to collect()
+                if omitted, which reuses the cached result when it is fresh,
                 so this stays a drop-in call on its own.
         """
         if metrics is None:
             metrics = self.collect()
 
-        cpu_ok = metrics["cpu_usage_percent"] < self.get_threshold("cpu_usage_percent")
-        mem_ok = metrics["memory_usage_percent"] < self.get_threshold("memory_usage_percent")
+        thresholds = self._thresholds
+        cpu_ok = metrics["cpu_usage_percent"] < thresholds["cpu_usage_percent"]
+        mem_ok = metrics["memory_usage_percent"] < thresholds["memory_usage_percent"]
 
-        disk_ok = metrics["disk_usage_percent"] < self.get_threshold("disk_usage_percent")
-        load_ok = metrics["load_average"] < self.get_threshold("load_average_limit")
+        disk_ok = metrics["disk_usage_percent"] < thresholds["disk_usage_percent"]
+        load_ok = metrics["load_average"] < thresholds["load_average"]
 
         return cpu_ok and mem_ok and disk_ok and load_ok
\ No newline at end of file
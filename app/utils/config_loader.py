@@ -6,15 +6,46 @@ configuration. It supports:
 - .env file for secrets (API tokens, email credentials, etc.)
 - YAML file for structured thresholds and settings
 - Dot-notation access for nested keys
+
+Nothing is read from disk at import time: the shared `config` object loads
+the .env and YAML files on first use.
 """
 
+import logging
 import os
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import yaml
 from dotenv import load_dotenv
 
+# Plain stdlib logger: app.utils.logger imports this module, so it can't be
+# imported back here. In practice the config is first loaded from inside
+# StructuredLogger._setup_logger(), before any handler is attached and while
+# the effective level is still WARNING - so the INFO/DEBUG startup messages
+# below are dropped, and a WARNING is printed unformatted by logging's
+# lastResort handler on stderr. Only later records (e.g. a reload) would
+# reach the structured handlers.
+_log = logging.getLogger("phoenixauto_ops.config")
+
+# libyaml's C loader when PyYAML was built with it, pure Python otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _flatten(node: Dict[str, Any], prefix: str, out: Dict[str, Any]) -> None:
+    """Record every key of a nested dict under its dotted path.
+
+    Dict branches are stored as well as leaves, so 'thresholds' still
+    resolves to the whole section just like 'thresholds.cpu_usage_percent'
+    resolves to a single value.
+    """
+    for key, value in node.items():
+        path = f"{prefix}{key}"
+        out[path] = value
+        if isinstance(value, dict):
+            _flatten(value, f"{path}.", out)
+
 
 class ConfigLoader:
     """Central configuration manager for PhoenixAuto-Ops.
@@ -46,6 +77,7 @@ class ConfigLoader:
         self.yaml_file = self.config_dir / yaml_file
 
         self._config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}  # Dotted key -> value, rebuilt on every load
         self._env_loaded = False
 
         self._load_environment()
@@ -56,32 +88,36 @@ class ConfigLoader:
         if self.env_file.exists():
             load_dotenv(self.env_file)
             self._env_loaded = True
-            print(".env file loaded successfully")
+            _log.info(".env file loaded successfully")
         else:
-            print(".env file not found - using system environment variables only")
+            _log.info(".env file not found - using system environment variables only")
 
     def _load_yaml_config(self) -> None:
         """Load configuration from YAML file, fallback to example if missing."""
         if self.yaml_file.exists():
             with open(self.yaml_file, "r", encoding="utf-8") as f:
-                self._config = yaml.safe_load(f) or {}
-            print(f"Loaded configuration from {self.yaml_file.name}")
+                self._config = yaml.load(f, Loader=_YamlLoader) or {}
+            _log.info("Loaded configuration from %s", self.yaml_file.name)
         else:
             example_file = self.config_dir / "thresholds.yaml.example"
             if example_file.exists():
-                print(f"{self.yaml_file.name} not found - copying example template")
+                _log.debug("%s not found - copying example template", self.yaml_file.name)
                 import shutil
                 shutil.copy(example_file, self.yaml_file)
                 self._load_yaml_config()  # recursive reload
             else:
-                print("No config files found - starting with empty configuration")
+                _log.warning("No config files found - starting with empty configuration")
                 self._config = {}
 
+        self._flat = {}
+        _flatten(self._config, "", self._flat)
+
     def get(self, key: str, default: Any = None) -> Any:
         """Retrieve a configuration value using dot notation.
 
         Supports nested access like 'thresholds.cpu_usage_percent' or
-        'auto_healing.enabled'.
+        'auto_healing.enabled'. Paths are precomputed at load time, so this
+        is a single dict lookup.
 
         Args:
             key: Dot-separated key path
@@ -90,15 +126,7 @@ class ConfigLoader:
         Returns:
             The configuration value or default
         """
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        return value
+        return self._flat.get(key, default)
 
     def get_threshold(self, metric_key: str, default: float = 80.0) -> float:
         """Get a threshold value by its direct key name.
@@ -130,5 +158,23 @@ class ConfigLoader:
         return self._config
 
 
-# Singleton instance - import and use directly
-config = ConfigLoader()
\ No newline at end of file
+class _LazyConfig:
+    """Proxy that constructs the real ConfigLoader on first attribute access."""
+
+    def __init__(self) -> None:
+        self._loader: Optional[ConfigLoader] = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the proxy itself
+        loader = self._loader
+        if loader is None:
+            with self._lock:
+                if self._loader is None:
+                    self._loader = ConfigLoader()
+                loader = self._loader
+        return getattr(loader, name)
+
+
+# Singleton instance - import and use directly (loaded on first use)
+config = _LazyConfig()
\ No newline at end of file
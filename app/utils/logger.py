@@ -7,10 +7,12 @@ Features:
 - Console output (human readable for development)
 - Rotating file logs (daily rotation, 7 days retention)
 - JSON structured format for file logs (easy to parse by tools)
-- Singleton pattern to prevent duplicate handlers
+- Single module-level instance (created at import) to prevent duplicate handlers
 - Automatic integration with ConfigLoader for log level
 - Supports extra contextual data (structured logging)
 - Robust error handling with fallbacks
+- Handlers run on a background QueueListener thread, so callers only
+  enqueue the record and never block on formatting or disk writes
 
 Usage:
     from app.utils.logger import logger
@@ -18,86 +20,450 @@ Usage:
     logger.error("Service restart failed", exc_info=True)
 """
 
-import json
+import atexit
+import functools
+import glob
 import logging
-from logging.handlers import TimedRotatingFileHandler
-from pathlib import Path
-from typing import Any
+import os
+import queue
+import socket
+import sys
+import threading
+import time
+import traceback
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Tuple
 
 from app.utils.config_loader import config
 
+# Level constants re-exported so callers can gate work without importing logging
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+CRITICAL = logging.CRITICAL
+
+# File logs are serialized with orjson (C extension, emits UTF-8 bytes
+# directly) when it is installed, and with stdlib json otherwise.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        # Compact separators, matching orjson, so pre-encoded fragments
+        # (see _encode_call_site) splice into the same line format.
+        return json.dumps(obj, ensure_ascii=False, default=str, separators=(",", ":")).encode("utf-8")
+
+
+# File log location, relative to the working directory
+_LOG_DIR = "logs"
+_LOG_PATH = os.path.join(_LOG_DIR, "phoenixauto-ops.log")
+
+# Host name stamped on every JSON record, resolved once at import
+_HOSTNAME = socket.gethostname()
+
+# Attributes every LogRecord carries. Anything else on a record came from
+# the caller's extra= and belongs in the JSON output. Interned so set
+# lookups against record attribute names match on identity. (The JSON key
+# literals in format_bytes are code constants and already interned.)
+_RESERVED_ATTRS = frozenset(map(sys.intern, (
+    *logging.LogRecord("", 0, "", 0, "", (), None).__dict__,
+    "message",
+    "asctime",
+)))
+
+# Top-level JSON keys written by JSONFormatter. Extras never override
+# them: a colliding extra is written as "extra_<key>" instead.
+_BASE_FIELDS = frozenset(
+    ("timestamp", "level", "message", "module", "function", "line", "hostname", "pid", "exception")
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_call_site(level: str, module: str, function: str, line: int) -> Tuple[bytes, bytes]:
+    """Pre-encoded JSON fragments that are fixed for one call site and level.
+
+    Returns the bytes that go between the timestamp and the message
+    (',"level":...,"message":') and the bytes that follow the message
+    (',"module":...,"hostname":...'). A given logging call produces the same
+    fragments every time, so they are encoded once, not per record.
+    """
+    head = b',"level":' + _dumps(level) + b',"message":'
+    site = b"," + _dumps({
+        "module": module,
+        "function": function,
+        "line": line,
+        "hostname": _HOSTNAME,
+    })[1:-1]
+    return head, site
+
+
+# Shared empty mapping for the optional ** merges in JSONFormatter - never mutated
+_NO_FIELDS: Dict[str, Any] = {}
+
+
+def _extract_extras(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    """Collect caller-supplied extra fields from a record's __dict__.
+
+    logging stores extra= keys as record attributes; an "extra" attribute
+    holding a dict (from extra={"extra": {...}}) is merged in flat as well.
+    Keys that clash with a core JSON field are prefixed with "extra_" so
+    e.g. a level= extra cannot rewrite the record's level. Callers check
+    for extras first (see JSONFormatter.format_bytes).
+    """
+    extras: Dict[str, Any] = {}
+    for key, value in attrs.items():  # iterate attrs, not the set, to keep call order
+        if key in _RESERVED_ATTRS:
+            continue
+        if key == "extra" and isinstance(value, dict):
+            extras.update(value)
+        else:
+            extras[key] = value
+    if not extras.keys().isdisjoint(_BASE_FIELDS):
+        extras = {
+            (f"extra_{key}" if key in _BASE_FIELDS else key): value
+            for key, value in extras.items()
+        }
+    return extras
+
+
+def _exception_fields(exc_info: Any) -> Dict[str, Any]:
+    """Structured form of a record's exc_info for the JSON output.
+
+    Keeps type, message and traceback frames as separate fields instead of
+    one formatException() string, so log tools can query them directly.
+    """
+    exc_type, exc, tb = exc_info
+    return {
+        "type": exc_type.__name__ if exc_type is not None else None,
+        "message": str(exc),
+        "traceback": traceback.format_tb(tb) if tb is not None else [],
+    }
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging in files."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Bind per-record helpers once instead of per format() call."""
+        super().__init__(*args, **kwargs)
+        self._format_time = self.formatTime
+        # Second-resolution timestamp prefix, reused while records keep
+        # landing in the same second
+        self._last_sec = -1
+        self._last_prefix = ""
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        """Same output as formatTime() with the default datefmt.
+
+        Calls localtime + strftime at most once per second rather than once
+        per record; only the millisecond suffix is formatted each time.
+        """
+        if self.datefmt:
+            return self._format_time(record, self.datefmt)
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_prefix = time.strftime(self.default_time_format, self.converter(sec))
+            self._last_sec = sec
+        return f"{self._last_prefix},{int(record.msecs):03d}"
+
     def format(self, record: logging.LogRecord) -> str:
-        """Convert log record to JSON with extra context, safely."""
-        log_entry = {
-            "timestamp": self.formatTime(record, self.datefmt),
-            "level": record.levelname,
-            "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
-        }
+        """Convert log record to a JSON line with extra context, safely."""
+        return self.format_bytes(record).decode("utf-8")
 
-        # Safely add extra contextual data
-        extra_data = getattr(record, "extra", None)
-        if extra_data is not None:
-            try:
-                log_entry.update(extra_data)
-            except Exception:
-                log_entry["extra_error"] = "Failed to serialize extra data"
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Convert log record to UTF-8 JSON bytes.
+
+        Handlers that write bytes can call this directly and skip the
+        str round trip in format().
+        """
+        try:
+            attrs = record.__dict__
+            # Set difference on the keys view runs in C - the common
+            # no-extras record skips the Python-level extraction loop.
+            extra_data = _extract_extras(attrs) if attrs.keys() - _RESERVED_ATTRS else None
+            # _RecordQueueHandler.prepare() has already merged the %-args,
+            # so the usual record needs no getMessage() call.
+            message = record.msg
+            if record.args or type(message) is not str:
+                message = record.getMessage()
+
+            # Splice the cached call-site fragments around the encoded
+            # timestamp and message; only pid, extras and the exception
+            # are encoded as a dict, and its "{" is dropped to join on.
+            head, site = _encode_call_site(
+                record.levelname, record.module, record.funcName, record.lineno
+            )
+            if extra_data is None and not record.exc_info:
+                # Common case: pid is the only dynamic field left, so
+                # format it directly and skip building the tail dict.
+                # (process is None when logging.logProcesses is off)
+                pid = record.process
+                tail = b'"pid":%d}' % pid if pid is not None else b'"pid":null}'
+            else:
+                tail = memoryview(_dumps({
+                    "pid": record.process,
+                    **(extra_data or _NO_FIELDS),
+                    **({"exception": _exception_fields(record.exc_info)} if record.exc_info else _NO_FIELDS),
+                }))[1:]
+            return b"".join((
+                b'{"timestamp":', _dumps(self._timestamp(record)),
+                head, _dumps(message), site, b",", tail,
+            ))
+        except Exception as e:
+            # Minimal record that is still valid JSON whatever the message
+            # contains; stdlib json is imported here only, off the hot path.
+            import json
+            return json.dumps({
+                "error": f"JSON serialization failed: {e}",
+                "original_message": str(record.msg),
+            }, ensure_ascii=False).encode("utf-8")
+
+
+def _parse_level(name: Any) -> int:
+    """Map a level name like 'info' to its logging constant, INFO if unknown."""
+    level = logging.getLevelName(str(name).upper())
+    return level if isinstance(level, int) else logging.INFO
+
+
+class _RecordQueueHandler(QueueHandler):
+    """QueueHandler that keeps records structured for the JSON formatter.
+
+    The stock prepare() formats the whole record on the caller thread and
+    strips exc_info, flattening the traceback into the message. Here only
+    the %-args are merged - they may be mutated once the call returns - and
+    exc_info and extras stay on the record for the listener's handlers.
+    """
+
+    # Listener draining this handler's queue, so later StructuredLogger
+    # instances can find it
+    listener: Optional[QueueListener] = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
-        # Safely add exception info
-        if record.exc_info:
+
+class BatchingFileHandler(logging.Handler):
+    """Daily-rotating JSON file handler that batches writes on its own thread.
+
+    emit() only appends the record's JSON bytes to an in-memory buffer. A
+    writer thread drains the buffer with a single write() every
+    flush_interval seconds, as soon as it exceeds max_buffer bytes, or
+    right away for ERROR+ records. Rotation (rename to <file>.YYYY-MM-DD,
+    keep backup_count old files) also happens on the writer thread, at
+    local midnight like TimedRotatingFileHandler(when="midnight").
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        backup_count: int = 7,
+        flush_interval: float = 0.1,
+        max_buffer: int = 64 * 1024,
+    ) -> None:
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self._backup_count = backup_count
+        self._flush_interval = flush_interval
+        self._max_buffer = max_buffer
+
+        self._buffer = bytearray()
+        self._buffer_lock = threading.Lock()
+        self._io_lock = threading.Lock()  # serializes write/rotate/close
+        self._wake = threading.Event()
+        self._closed = False
+
+        self._fd: Optional[int] = self._open()
+        # Like TimedRotatingFileHandler, base the first rollover on the
+        # existing file's mtime so yesterday's file still gets rotated.
+        self._rollover_at = _next_midnight(os.stat(self.baseFilename).st_mtime)
+
+        self._writer = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._writer.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Serialize the record and append it to the pending buffer."""
+        try:
+            formatter = self.formatter
+            if isinstance(formatter, JSONFormatter):
+                data = formatter.format_bytes(record)
+            else:
+                data = self.format(record).encode("utf-8")
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self._buffer_lock:
+            self._buffer += data
+            self._buffer += b"\n"
+            full = len(self._buffer) >= self._max_buffer
+        if full or record.levelno >= logging.ERROR:
+            self._wake.set()
+
+    def _run(self) -> None:
+        """Writer loop: drain the buffer every flush_interval or when woken."""
+        while not self._closed:
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Write everything buffered so far, rotating first if it is due."""
+        with self._buffer_lock:
+            if not self._buffer and time.time() < self._rollover_at:
+                return
+            data, self._buffer = self._buffer, bytearray()
+
+        with self._io_lock:
+            if self._fd is None and self._closed:
+                return
+            # A failed rotation is reported but must not cost this batch
+            if time.time() >= self._rollover_at:
+                try:
+                    self._rotate()
+                except Exception:
+                    self.handleError(None)
             try:
-                log_entry["exception"] = self.formatException(record.exc_info)
+                if self._fd is None:  # reopen failed last time - try again
+                    self._fd = self._open()
+                if data:
+                    self._write(data)
             except Exception:
-                log_entry["exception"] = "Failed to format exception"
+                self.handleError(None)
+
+    def _open(self) -> int:
+        """Open the log file as a raw O_APPEND descriptor.
+
+        Batches are already assembled in self._buffer, so a buffered file
+        object would only add a second copy; each batch goes straight to
+        os.write, and O_APPEND keeps it atomic with respect to other writers.
+        """
+        return os.open(self.baseFilename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def _write(self, data: bytearray) -> None:
+        """Write a whole batch to the descriptor, looping on short writes."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
+
+    def _rotate(self) -> None:
+        """Rename the current file to its dated name and start a new one.
 
+        The descriptor is reopened and the next rollover scheduled even if
+        the rename or cleanup fails, so one bad rotation (e.g. the file was
+        removed underneath us) can't leave the handler holding a closed
+        descriptor number that may since belong to another file.
+        """
+        os.close(self._fd)
+        self._fd = None
         try:
-            return json.dumps(log_entry, ensure_ascii=False, default=str)
-        except Exception as e:
-            # Fallback to plain text if JSON fails
-            return f'{{"error": "JSON serialization failed: {str(e)}", "original_message": "{log_entry["message"]}"}}'
+            # Like TimedRotatingFileHandler, skip the rename if the file is gone
+            if os.path.exists(self.baseFilename):
+                rolled = f"{self.baseFilename}.{time.strftime('%Y-%m-%d', time.localtime(self._rollover_at - 86400))}"
+                if os.path.exists(rolled):
+                    os.remove(rolled)
+                os.rename(self.baseFilename, rolled)
+
+            if self._backup_count > 0:
+                backups = sorted(glob.glob(f"{glob.escape(self.baseFilename)}.????-??-??"))
+                for old in backups[:-self._backup_count]:
+                    os.remove(old)
+        finally:
+            self._rollover_at = _next_midnight(time.time())
+            self._fd = self._open()
+
+    def close(self) -> None:
+        """Stop the writer thread, write what is left and close the file."""
+        if not self._closed:
+            self._closed = True
+            self._wake.set()
+            if self._writer is not threading.current_thread():
+                self._writer.join(timeout=5)
+            self.flush()
+            with self._io_lock:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+        super().close()
+
+
+def _next_midnight(now: float) -> float:
+    """Epoch time of the next local midnight after now."""
+    t = time.localtime(now)
+    # mktime normalizes tm_mday overflow into the next month/year
+    return time.mktime((t.tm_year, t.tm_mon, t.tm_mday + 1, 0, 0, 0, 0, 0, -1))
 
 
 class StructuredLogger:
-    """Singleton structured logger for PhoenixAuto-Ops.
+    """Structured logger for PhoenixAuto-Ops.
 
-    Ensures only one logger instance exists.
-    Loads log level from config with fallback.
+    All instances share the "phoenixauto_ops" logger. Handlers are attached
+    by the first instance only; later ones reuse them, so constructing
+    another StructuredLogger never duplicates output. Prefer the
+    module-level `logger` (or get_logger()).
+    Loads log level from config with fallback, on first use rather than
+    at construction, so importing a module that logs does no config I/O.
     Handles setup errors gracefully.
     """
 
-    _instance = None
+    def __init__(self) -> None:
+        """Defer handler setup until the first log call."""
+        self.logger = logging.getLogger("phoenixauto_ops")
+        self._setup_lock = threading.Lock()
+        # Every public method checks _is_enabled first. Until setup has run
+        # it points at _setup_and_check; _setup_logger() rebinds it to the
+        # stdlib check, so the steady-state path carries no extra branch.
+        self._is_enabled = self._setup_and_check
 
-    def __new__(cls) -> "StructuredLogger":
-        """Create or return existing singleton instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._setup_logger()
-        return cls._instance
+    def _setup_and_check(self, level: int) -> bool:
+        """Run _setup_logger() once, then answer the pending level check."""
+        with self._setup_lock:
+            if self._is_enabled == self._setup_and_check:
+                self._setup_logger()
+                # Switched only once handlers exist, so no caller can get
+                # past the check and log into an unconfigured logger
+                self._is_enabled = self.logger.isEnabledFor
+        return self._is_enabled(level)
 
     def _setup_logger(self) -> None:
         """Configure console and rotating file handlers with error handling."""
-        self.logger = logging.getLogger("phoenixauto_ops")
+        # Bound once: _emit() builds records itself instead of going through
+        # Logger.info() -> _log() -> findCaller() -> makeRecord() per call.
+        self._make_record = self.logger.makeRecord
+        self._handle = self.logger.handle
+
+        # Idempotent: if handlers are already attached, share their listener
+        # rather than adding a second queue, listener and writer thread.
+        for handler in self.logger.handlers:
+            if isinstance(handler, _RecordQueueHandler):
+                self._listener = handler.listener
+                return
 
-        # Load log level from config with fallback
+        # Load log levels from config with fallback. Console and file levels
+        # can differ (e.g. console=WARNING, file=INFO); each handler filters
+        # on its own level before formatting, so the JSON pipeline never runs
+        # for records the file won't keep. The logger passes the lower of
+        # the two.
         try:
-            log_level_str = config.get("logging.level", "INFO").upper()
-            self.logger.setLevel(getattr(logging, log_level_str, logging.INFO))
+            log_level_str = config.get("logging.level", "INFO")
+            console_level = _parse_level(config.get("logging.console_level", log_level_str))
+            file_level = _parse_level(config.get("logging.file_level", log_level_str))
         except Exception as e:
-            self.logger.setLevel(logging.INFO)
+            console_level = file_level = logging.INFO
             print(f"Warning: Failed to load log level from config: {e}. Using INFO.")
+        self.logger.setLevel(min(console_level, file_level))
 
         self.logger.propagate = False  # Prevent duplicate propagation
 
         # Create logs directory safely
-        log_dir = Path("logs")
         try:
-            log_dir.mkdir(exist_ok=True)
+            os.makedirs(_LOG_DIR, exist_ok=True)
         except OSError as e:
             print(f"Warning: Could not create logs directory: {e}. Console only.")
 
@@ -108,45 +474,144 @@ class StructuredLogger:
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+        console_handler.setLevel(console_level)
+        handlers = [console_handler]
+        file_error = None
 
         # File Handler (JSON + rotation) with try-except
         try:
-            file_handler = TimedRotatingFileHandler(
-                filename=log_dir / "phoenixauto-ops.log",
-                when="midnight",
-                interval=1,
-                backupCount=7,
-                encoding="utf-8",
+            file_handler = BatchingFileHandler(
+                filename=_LOG_PATH,
+                backup_count=7,
+                flush_interval=config.get("logging.flush_interval_seconds", 0.1),
+                max_buffer=config.get("logging.buffer_bytes", 64 * 1024),
             )
             file_handler.setFormatter(JSONFormatter())
-            self.logger.addHandler(file_handler)
-            self.logger.info("File logging enabled with rotation")
+            file_handler.setLevel(file_level)
+            handlers.append(file_handler)
         except Exception as e:
-            self.logger.warning(f"Failed to setup file logging: {e}. Using console only.")
+            file_error = e
+
+        # The logger itself only enqueues; formatting, console and file I/O
+        # (including midnight rotation) happen on the listener thread.
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        queue_handler = _RecordQueueHandler(log_queue)
+        self._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        queue_handler.listener = self._listener
+        self.logger.addHandler(queue_handler)
+        self._listener.start()
+        atexit.register(self._listener.stop)  # flush queued records on exit
+
+        if file_error is None:
+            self.logger.info("File logging enabled with rotation")
+        else:
+            self.logger.warning(f"Failed to setup file logging: {file_error}. Using console only.")
 
         self.logger.info("Structured logger initialized successfully")
 
-    def debug(self, message: str, **extra: Any) -> None:
+    def isEnabledFor(self, level: int) -> bool:
+        """Return True if a message at this level would be emitted."""
+        return self._is_enabled(level)
+
+    # Positional args are %-formatted lazily by logging, only if the record
+    # is actually emitted - prefer them over f-strings on hot paths. Each
+    # wrapper checks the level first so filtered calls return before any
+    # logging machinery runs. exc_info is passed through to logging rather
+    # than treated as an extra field (which logging rejects).
+
+    def _emit(
+        self,
+        level: int,
+        message: str,
+        args: tuple,
+        exc_info: Any,
+        extra: Optional[Dict[str, Any]],
+    ) -> None:
+        """Build a record for the wrapper's caller and hand it to the logger.
+
+        Must be called directly from a public wrapper: the frame two levels
+        up is the application code that logged. Reading it with
+        sys._getframe replaces findCaller()'s stack walk, and also makes
+        module/function/line point at that code rather than at this class.
+        """
+        frame = sys._getframe(2)
+        code = frame.f_code
+        if exc_info:
+            if isinstance(exc_info, BaseException):
+                exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+            elif not isinstance(exc_info, tuple):
+                exc_info = sys.exc_info()
+        record = self._make_record(
+            self.logger.name, level, code.co_filename, frame.f_lineno,
+            message, args, exc_info, code.co_name, extra,
+        )
+        self._handle(record)
+
+    def log(self, level: int, message: str, *args: Any, exc_info: Any = None, **extra: Any) -> None:
+        """Log at a numeric level (one of the module's level constants)."""
+        if self._is_enabled(level):
+            self._emit(level, message, args, exc_info, extra or None)
+
+    def debug(self, message: str, *args: Any, exc_info: Any = None, **extra: Any) -> None:
         """Log debug level message with optional structured data."""
-        self.logger.debug(message, extra=extra)
+        if self._is_enabled(DEBUG):
+            self._emit(DEBUG, message, args, exc_info, extra or None)
 
-    def info(self, message: str, **extra: Any) -> None:
+    def info(self, message: str, *args: Any, exc_info: Any = None, **extra: Any) -> None:
         """Log info level message with optional structured data."""
-        self.logger.info(message, extra=extra)
+        if self._is_enabled(INFO):
+            self._emit(INFO, message, args, exc_info, extra or None)
 
-    def warning(self, message: str, **extra: Any) -> None:
+    def warning(self, message: str, *args: Any, exc_info: Any = None, **extra: Any) -> None:
         """Log warning level message with optional structured data."""
-        self.logger.warning(message, extra=extra)
+        if self._is_enabled(WARNING):
+            self._emit(WARNING, message, args, exc_info, extra or None)
 
-    def error(self, message: str, **extra: Any) -> None:
+    def error(self, message: str, *args: Any, exc_info: Any = None, **extra: Any) -> None:
         """Log error level message with optional structured data."""
-        self.logger.error(message, extra=extra)
+        if self._is_enabled(ERROR):
+            self._emit(ERROR, message, args, exc_info, extra or None)
 
-    def critical(self, message: str, **extra: Any) -> None:
+    def critical(self, message: str, *args: Any, exc_info: Any = None, **extra: Any) -> None:
         """Log critical level message with optional structured data."""
-        self.logger.critical(message, extra=extra)
+        if self._is_enabled(CRITICAL):
+            self._emit(CRITICAL, message, args, exc_info, extra or None)
+
+    # *_ctx variants take an already-built dict (or None) so hot callers can
+    # reuse one context dict instead of allocating **kwargs per call.
+
+    def debug_ctx(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        """Log debug level message with a prebuilt context dict."""
+        if self._is_enabled(DEBUG):
+            self._emit(DEBUG, message, (), None, extra)
+
+    def info_ctx(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        """Log info level message with a prebuilt context dict."""
+        if self._is_enabled(INFO):
+            self._emit(INFO, message, (), None, extra)
+
+    def warning_ctx(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        """Log warning level message with a prebuilt context dict."""
+        if self._is_enabled(WARNING):
+            self._emit(WARNING, message, (), None, extra)
+
+    def error_ctx(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        """Log error level message with a prebuilt context dict."""
+        if self._is_enabled(ERROR):
+            self._emit(ERROR, message, (), None, extra)
+
+    def critical_ctx(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        """Log critical level message with a prebuilt context dict."""
+        if self._is_enabled(CRITICAL):
+            self._emit(CRITICAL, message, (), None, extra)
+
+
+@functools.lru_cache(maxsize=1)
+def get_logger() -> StructuredLogger:
+    """Return the process-wide StructuredLogger, creating it on first call."""
+    return StructuredLogger()
 
 
-# Singleton instance - import and use directly
-logger = StructuredLogger()
\ No newline at end of file
+# Created at import without touching config - handlers are set up on the
+# first log call. Import and use directly.
+logger = get_logger()
\ No newline at end of file